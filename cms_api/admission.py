@@ -0,0 +1,150 @@
+import json
+import math
+import time
+
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+from database import engine, checkout_wait, CheckoutWait, TimedQueuePool, POOL_SIZE, MAX_OVERFLOW
+
+# ── Admission control ────────────────────────────────────────
+# Caps how many requests run at once, and rejects the excess straight away with
+# 503 + Retry-After instead of letting them queue on the connection pool until
+# the 30s checkout timeout.
+#
+# The cap is AIMD: it grows by about 1 per `limit` requests while requests are
+# using most of it and not waiting on the pool, and it shrinks by BACKOFF when
+# a request waited longer than WAIT_THRESHOLD for a connection, or hit a pool
+# timeout / OperationalError. Other failures (e.g. an IntegrityError 500) are
+# the request's own problem and leave the limit alone.
+#
+# Priority classes:
+#   critical : health check and /admin/* — always admitted
+#   read     : GET / HEAD — admitted up to the full limit
+#   write    : everything else — admitted up to WRITE_SHARE of the limit,
+#              so reads keep headroom while bulk writes are shed first
+
+MIN_LIMIT        = 2
+MAX_LIMIT        = 200
+INITIAL_LIMIT    = POOL_SIZE + MAX_OVERFLOW  # what the pool can serve at once
+WAIT_THRESHOLD   = 0.050   # seconds of checkout wait per request that counts as congestion
+BACKOFF          = 0.9
+BACKOFF_COOLDOWN = 1.0     # seconds between two decreases
+WRITE_SHARE      = 0.8
+
+CRITICAL_PATHS = ("/", "/docs", "/openapi.json")
+
+
+def priority_of(method: str, path: str) -> str:
+    if path in CRITICAL_PATHS or path.startswith("/admin/"):
+        return "critical"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+
+class AdaptiveLimiter:
+    # Only touched from the event loop thread, so no locking needed
+    def __init__(self, initial: float = INITIAL_LIMIT):
+        self.limit         = float(initial)
+        self.inflight      = 0
+        self.last_decrease = 0.0
+        self.admitted      = {"critical": 0, "read": 0, "write": 0}
+        self.rejected      = {"critical": 0, "read": 0, "write": 0}
+        self.inflight_by   = {"critical": 0, "read": 0, "write": 0}
+
+    def try_acquire(self, priority: str) -> bool:
+        if priority == "read":
+            allowed = self.inflight < int(self.limit)
+        elif priority == "write":
+            allowed = self.inflight < int(self.limit * WRITE_SHARE)
+        else:
+            allowed = True
+        if not allowed:
+            self.rejected[priority] += 1
+            return False
+        self.admitted[priority] += 1
+        self.inflight_by[priority] += 1
+        if priority != "critical":
+            self.inflight += 1
+        return True
+
+    def release(self, priority: str, waited: float, congested: bool) -> None:
+        saturated = self.inflight >= int(self.limit) - 1
+        self.inflight_by[priority] -= 1
+        if priority == "critical":
+            return
+        self.inflight -= 1
+
+        if congested or waited > WAIT_THRESHOLD:
+            now = time.monotonic()
+            if now - self.last_decrease >= BACKOFF_COOLDOWN:
+                self.limit = max(MIN_LIMIT, self.limit * BACKOFF)
+                self.last_decrease = now
+        elif saturated:
+            self.limit = min(MAX_LIMIT, self.limit + 1 / self.limit)
+
+    def retry_after(self) -> int:
+        # whole seconds, at least 1, longer while the pool is slow to hand out connections
+        return max(1, math.ceil(TimedQueuePool.wait_ewma * 10))
+
+    def snapshot(self) -> dict:
+        pool = engine.pool
+        return {
+            "limit":            int(self.limit),
+            "write_limit":      int(self.limit * WRITE_SHARE),
+            "inflight":         self.inflight,
+            "inflight_by":      dict(self.inflight_by),
+            "admitted":         dict(self.admitted),
+            "rejected":         dict(self.rejected),
+            "pool_size":        pool.size(),
+            "pool_checked_out": pool.checkedout(),
+            "pool_overflow":    pool.overflow(),
+            "pool_wait_ms":     round(TimedQueuePool.wait_ewma * 1000, 3),
+        }
+
+
+limiter = AdaptiveLimiter()
+
+
+class AdmissionControlMiddleware:
+    # Plain ASGI middleware, so the checkout_wait context var set here is
+    # the one the route's threadpool worker sees
+    def __init__(self, app, limiter: AdaptiveLimiter = limiter):
+        self.app     = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = priority_of(scope["method"], scope["path"])
+        if not self.limiter.try_acquire(priority):
+            await self._reject(send)
+            return
+
+        wait      = CheckoutWait()
+        token     = checkout_wait.set(wait)
+        congested = False
+
+        try:
+            await self.app(scope, receive, send)
+        except (PoolTimeoutError, OperationalError):
+            congested = True
+            raise
+        finally:
+            checkout_wait.reset(token)
+            self.limiter.release(priority, wait.seconds, congested=congested)
+
+    async def _reject(self, send):
+        body = json.dumps({"detail": "Server is overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type",   b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after",    str(self.limiter.retry_after()).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,157 @@
+"""partition comment by created_at month, sub-partitioned by post_id hash
+Revision ID: 7d2e5b8c1a94
+Revises: 49c97e981746
+Create Date: 2026-10-18 09:12:41.508113
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '7d2e5b8c1a94'
+down_revision: Union[str, Sequence[str], None] = '49c97e981746'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COMMENT_COLUMNS = (
+    "comment_id, post_id, user_id, category_id, body, "
+    "created_at, created_by, updated_at, updated_by"
+)
+
+# Frozen copy as of this revision — the app re-installs its current definition
+# (models.COMMENT_PARTITION_FN_SQL) at startup, so later changes go there only.
+# Creates one RANGE partition per UTC month (each split into HASH(post_id) buckets)
+# from from_month up to months_ahead past the current month.
+# Rows that already landed in comment_default for a new month are moved into it.
+# The advisory lock serialises concurrent callers (several workers starting at once).
+ENSURE_COMMENT_PARTITIONS_FN = """
+CREATE OR REPLACE FUNCTION mg_schema.ensure_comment_partitions(
+    months_ahead integer     DEFAULT 3,
+    from_month   timestamptz DEFAULT NULL
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    hash_buckets CONSTANT integer := 4;
+    month_start  timestamp := date_trunc('month', coalesce(from_month, now()) AT TIME ZONE 'UTC');
+    last_month   timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead);
+    lower_bound  timestamptz;
+    upper_bound  timestamptz;
+    part_name    text;
+    created      integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('mg_schema.comment partitions'));
+
+    WHILE month_start <= last_month LOOP
+        part_name   := 'comment_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+        lower_bound := month_start AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+        IF to_regclass('mg_schema.' || part_name) IS NULL THEN
+            CREATE TEMP TABLE comment_spill (LIKE mg_schema.comment) ON COMMIT DROP;
+            WITH moved AS (
+                DELETE FROM mg_schema.comment_default
+                 WHERE created_at >= lower_bound AND created_at < upper_bound
+                RETURNING *
+            )
+            INSERT INTO comment_spill SELECT * FROM moved;
+
+            EXECUTE format(
+                'CREATE TABLE mg_schema.%I PARTITION OF mg_schema.comment '
+                'FOR VALUES FROM (%L) TO (%L) PARTITION BY HASH (post_id)',
+                part_name, lower_bound, upper_bound
+            );
+            FOR bucket IN 0 .. hash_buckets - 1 LOOP
+                EXECUTE format(
+                    'CREATE TABLE mg_schema.%I PARTITION OF mg_schema.%I '
+                    'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+                    part_name || '_p' || bucket, part_name, hash_buckets, bucket
+                );
+            END LOOP;
+
+            INSERT INTO mg_schema.comment SELECT * FROM comment_spill;
+            DROP TABLE comment_spill;
+            created := created + 1;
+        END IF;
+
+        month_start := month_start + interval '1 month';
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    # Move the plain table out of the way — index names are schema-wide, so free them up
+    op.drop_index('idx_comment_post', table_name='comment', schema='mg_schema')
+    op.drop_index('idx_comment_user', table_name='comment', schema='mg_schema')
+    op.rename_table('comment', 'comment_legacy', schema='mg_schema')
+    op.execute('ALTER TABLE mg_schema.comment_legacy RENAME CONSTRAINT comment_pkey TO comment_legacy_pkey')
+
+    # Partitioned parent — the primary key must contain the partition key of
+    # every level: created_at (RANGE) and post_id (HASH, per month)
+    # comment_id keeps drawing from the existing sequence so ids stay stable
+    op.execute("""
+        CREATE TABLE mg_schema.comment (
+            comment_id  INT          NOT NULL DEFAULT nextval('mg_schema.comment_comment_id_seq'),
+            post_id     INT          NOT NULL REFERENCES mg_schema.post(post_id) ON DELETE CASCADE,
+            user_id     INT          NOT NULL REFERENCES mg_schema."user"(user_id),
+            category_id INT          NOT NULL REFERENCES mg_schema.category(category_id),
+            body        TEXT         NOT NULL,
+            created_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            created_by  INT          REFERENCES mg_schema."user"(user_id),
+            updated_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            updated_by  INT          REFERENCES mg_schema."user"(user_id),
+            PRIMARY KEY (comment_id, created_at, post_id)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.create_index('idx_comment_post', 'comment', ['post_id'], unique=False, schema='mg_schema')
+    op.create_index('idx_comment_user', 'comment', ['user_id'], unique=False, schema='mg_schema')
+    op.execute('CREATE TABLE mg_schema.comment_default PARTITION OF mg_schema.comment DEFAULT')
+
+    # Create partitions from the oldest existing comment up to 3 months ahead
+    op.execute(ENSURE_COMMENT_PARTITIONS_FN)
+    op.execute(
+        "SELECT mg_schema.ensure_comment_partitions("
+        "3, (SELECT min(created_at) FROM mg_schema.comment_legacy))"
+    )
+
+    op.execute(
+        f"INSERT INTO mg_schema.comment ({COMMENT_COLUMNS}) "
+        f"SELECT {COMMENT_COLUMNS} FROM mg_schema.comment_legacy"
+    )
+
+    # Hand the sequence to the new table before dropping the old one (drop would take it along)
+    op.execute('ALTER SEQUENCE mg_schema.comment_comment_id_seq OWNED BY mg_schema.comment.comment_id')
+    op.drop_table('comment_legacy', schema='mg_schema')
+
+
+def downgrade() -> None:
+    op.rename_table('comment', 'comment_partitioned', schema='mg_schema')
+    op.drop_index('idx_comment_post', table_name='comment_partitioned', schema='mg_schema')
+    op.drop_index('idx_comment_user', table_name='comment_partitioned', schema='mg_schema')
+    op.execute('ALTER TABLE mg_schema.comment_partitioned RENAME CONSTRAINT comment_pkey TO comment_partitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE mg_schema.comment (
+            comment_id  INT          PRIMARY KEY DEFAULT nextval('mg_schema.comment_comment_id_seq'),
+            post_id     INT          NOT NULL REFERENCES mg_schema.post(post_id) ON DELETE CASCADE,
+            user_id     INT          NOT NULL REFERENCES mg_schema."user"(user_id),
+            category_id INT          NOT NULL REFERENCES mg_schema.category(category_id),
+            body        TEXT         NOT NULL,
+            created_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            created_by  INT          REFERENCES mg_schema."user"(user_id),
+            updated_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            updated_by  INT          REFERENCES mg_schema."user"(user_id)
+        )
+    """)
+    op.execute(
+        f"INSERT INTO mg_schema.comment ({COMMENT_COLUMNS}) "
+        f"SELECT {COMMENT_COLUMNS} FROM mg_schema.comment_partitioned"
+    )
+    op.create_index('idx_comment_post', 'comment', ['post_id'], unique=False, schema='mg_schema')
+    op.create_index('idx_comment_user', 'comment', ['user_id'], unique=False, schema='mg_schema')
+
+    op.execute('ALTER SEQUENCE mg_schema.comment_comment_id_seq OWNED BY mg_schema.comment.comment_id')
+    op.drop_table('comment_partitioned', schema='mg_schema')   # drops every partition with it
+    op.execute('DROP FUNCTION IF EXISTS mg_schema.ensure_comment_partitions(integer, timestamptz)')
@@ -0,0 +1,122 @@
+"""Benchmark: per-post comment queries against the partitioned comment table.
+
+Runs the same query list_comments issues for ?post_id=N, checks via
+EXPLAIN (ANALYZE, FORMAT JSON) how many leaf partitions were actually scanned,
+and times it.
+
+Run from cms_api/:
+    python benchmarks/bench_comment_partitions.py --seed 200000 --iterations 200
+
+--seed inserts synthetic comments spread over the last 12 months inside a
+transaction that is rolled back at the end, so the database is left untouched.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+# ── Add project root to path so database & models are importable ──
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine, SessionLocal
+from models import CommentORM
+
+
+def _leaf_partitions(conn) -> set[str]:
+    rows = conn.execute(text(
+        "SELECT relid::regclass::text FROM pg_partition_tree('mg_schema.comment') WHERE isleaf"
+    )).scalars()
+    return {r.split(".")[-1].strip('"') for r in rows}
+
+
+def _scanned_relations(plan: dict) -> set[str]:
+    # Walk the plan tree; pruned partitions never show up as scan nodes
+    found = set()
+    if "Relation Name" in plan and plan.get("Actual Loops", 1) > 0:
+        found.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found |= _scanned_relations(child)
+    return found
+
+
+def _seed(conn, rows: int) -> None:
+    # Make sure every seeded month has a real partition (DDL is rolled back too)
+    conn.execute(text("SELECT mg_schema.ensure_comment_partitions(3, now() - interval '12 months')"))
+    conn.execute(text("""
+        WITH p AS (
+            SELECT post_id, user_id, category_id,
+                   row_number() OVER (ORDER BY post_id) - 1 AS rn
+              FROM mg_schema.post
+        )
+        INSERT INTO mg_schema.comment (post_id, user_id, category_id, body, created_at)
+        SELECT p.post_id, p.user_id, p.category_id,
+               'bench comment ' || g,
+               now() - (random() * interval '365 days')
+          FROM generate_series(1, :rows) AS g
+          JOIN p ON p.rn = g % (SELECT count(*) FROM mg_schema.post)
+    """), {"rows": rows})
+    conn.execute(text("ANALYZE mg_schema.comment"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="synthetic comments to insert (rolled back)")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--post-id", type=int, default=None, help="defaults to the post with most comments")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            if args.seed:
+                _seed(conn, args.seed)
+
+            post_id = args.post_id or conn.execute(text(
+                "SELECT post_id FROM mg_schema.comment GROUP BY post_id ORDER BY count(*) DESC LIMIT 1"
+            )).scalar()
+            if post_id is None:
+                sys.exit("no comments to benchmark — rerun with --seed")
+
+            # Exactly the statement the list_comments route builds
+            with SessionLocal(bind=conn) as db:
+                query = (
+                    db.query(CommentORM)
+                    .filter(CommentORM.post_id == post_id)
+                    .order_by(CommentORM.comment_id)
+                )
+                stmt = str(query.statement.compile(
+                    dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+                ))
+
+            leaves  = _leaf_partitions(conn)
+            plan    = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {stmt}")).scalar()
+            plan    = plan if isinstance(plan, list) else json.loads(plan)
+            scanned = _scanned_relations(plan[0]["Plan"]) & leaves
+
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                conn.execute(text(stmt)).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            trans.rollback()
+
+    timings.sort()
+    print(f"post_id              : {post_id}")
+    print(f"leaf partitions      : {len(leaves)}")
+    print(f"partitions scanned   : {len(scanned)}  ({len(leaves) - len(scanned)} pruned)")
+    print(f"latency p50 / p95 ms : {statistics.median(timings):.3f} / {timings[int(len(timings) * 0.95) - 1]:.3f}")
+
+    # One hash bucket per month at most (+ the default partition)
+    months = sum(1 for name in leaves if name.endswith("_p0")) + 1
+    if len(scanned) > months:
+        sys.exit(f"partition pruning did not happen: scanned {sorted(scanned)}")
+
+
+if __name__ == "__main__":
+    main()
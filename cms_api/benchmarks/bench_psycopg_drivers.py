@@ -0,0 +1,141 @@
+"""Benchmark: psycopg2 vs psycopg 3 on the same routes.
+
+Every connection goes through a small local TCP proxy that counts round trips
+(a client send that follows a server reply starts a new one) and can add
+artificial latency to each of them, so the difference from prepared statements
+shows up the way it would over a real network.
+
+Run from cms_api/:
+    python benchmarks/bench_psycopg_drivers.py --iterations 200 --rtt-ms 1
+
+Uses DATABASE_URL (driver part is swapped per run). create_user rows are
+deleted again after each call.
+"""
+import argparse
+import os
+import select
+import socket
+import statistics
+import sys
+import threading
+import time
+import uuid
+
+from sqlalchemy import make_url
+from sqlalchemy.orm import sessionmaker
+
+# ── Add project root to path so database, models & routes are importable ──
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DATABASE_URL, make_engine
+from models import UserCreate
+from routes_user_category import create_user, delete_user, get_user, list_categories
+from routes_post_comment import get_post, list_comments
+
+
+class RoundTripProxy:
+    # Forwards localhost:<port> to the real server and counts round trips
+    def __init__(self, target_host: str, target_port: int, rtt: float):
+        self.target = (target_host, target_port)
+        self.rtt    = rtt
+        self.trips  = 0
+        self._lock  = threading.Lock()
+        self._sock  = socket.create_server(("127.0.0.1", 0))
+        self.port   = self._sock.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            client, _ = self._sock.accept()
+            server = socket.create_connection(self.target)
+            for s in (client, server):
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._pump, args=(client, server), daemon=True).start()
+
+    def _pump(self, client, server):
+        last_from_server = True
+        try:
+            while True:
+                readable, _, _ = select.select([client, server], [], [])
+                for src in readable:
+                    data = src.recv(65536)
+                    if not data:
+                        return
+                    if src is client:
+                        if last_from_server:
+                            with self._lock:
+                                self.trips += 1
+                            if self.rtt:
+                                time.sleep(self.rtt)
+                        last_from_server = False
+                        server.sendall(data)
+                    else:
+                        last_from_server = True
+                        client.sendall(data)
+        except OSError:
+            pass
+        finally:
+            client.close()
+            server.close()
+
+
+def _routes():
+    # (name, callable(db)) — hot lookups plus the multi-statement create_user
+    def create_then_delete(db):
+        user = create_user(
+            UserCreate(username="bench", email=f"bench-{uuid.uuid4().hex}@example.com", password="x"),
+            created_by=None, db=db,
+        )
+        delete_user(user.user_id, db=db)
+
+    return [
+        ("get_user",        lambda db: get_user(1, db=db)),
+        ("get_post",        lambda db: get_post(1, db=db)),
+        ("list_comments",   lambda db: list_comments(post_id=1, db=db)),
+        ("list_categories", lambda db: list_categories(db=db)),
+        ("create_user",     create_then_delete),
+    ]
+
+
+def run(driver: str, iterations: int, rtt: float) -> dict:
+    url = make_url(DATABASE_URL)
+    proxy = RoundTripProxy(url.host or "127.0.0.1", url.port or 5432, rtt)
+    bench_url = url.set(drivername=f"postgresql+{driver}", host="127.0.0.1", port=proxy.port)
+    bench_url = bench_url.update_query_dict({"sslmode": "disable"})
+
+    engine  = make_engine(bench_url.render_as_string(hide_password=False))
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    results = {}
+    for name, call in _routes():
+        for _ in range(10):  # warm the pool and let psycopg 3 prepare statements
+            with Session() as db:
+                call(db)
+        proxy.trips = 0
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            with Session() as db:
+                call(db)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = (proxy.trips / iterations, statistics.median(timings))
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="latency added to every round trip")
+    args = parser.parse_args()
+
+    old = run("psycopg2", args.iterations, args.rtt_ms / 1000)
+    new = run("psycopg",  args.iterations, args.rtt_ms / 1000)
+
+    print(f"{'route':<16} {'trips psycopg2':>15} {'trips psycopg':>14} {'p50 ms psycopg2':>16} {'p50 ms psycopg':>15}")
+    for name in old:
+        (t2, l2), (t3, l3) = old[name], new[name]
+        print(f"{name:<16} {t2:>15.1f} {t3:>14.1f} {l2:>16.3f} {l3:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg
+from psycopg.rows import dict_row
 
 DB_CONFIG = {
     "dbname":   os.getenv("DB_NAME", "cms_db"),
@@ -10,5 +10,10 @@ DB_CONFIG = {
     "port":     os.getenv("DB_PORT", "5432"),
 }
 
+# Same setting database.py reads; see the note there
+_threshold = os.getenv("DB_PREPARE_THRESHOLD", "2")
+PREPARE_THRESHOLD = None if _threshold.lower() == "none" else int(_threshold)
+
 def get_conn():
-    return psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
\ No newline at end of file
+    # psycopg 3 — dict_row gives the same dict rows RealDictCursor did
+    return psycopg.connect(**DB_CONFIG, row_factory=dict_row, prepare_threshold=PREPARE_THRESHOLD)
\ No newline at end of file
@@ -0,0 +1,261 @@
+import cProfile
+import functools
+import hmac
+import inspect
+import io
+import itertools
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# ── Diagnostics (both opt-in) ────────────────────────────────
+# 1. Request profiler : cProfile of the route handler, for requests sent with
+#                       "X-Profile: 1" + a valid X-Admin-Token, or a random
+#                       PROFILE_SAMPLE_RATE share of all requests.
+#                       The response carries X-Profile-Id.
+# 2. Slow-query log   : statements slower than SLOW_QUERY_MS, with bound
+#                       parameters, the calling route and a plan captured on
+#                       the spot: EXPLAIN (ANALYZE, BUFFERS) for reads, plain
+#                       EXPLAIN for INSERT / UPDATE / DELETE.
+# Both keep their last entries in memory, browsable under /admin.
+
+ADMIN_TOKEN         = os.getenv("ADMIN_TOKEN")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+SLOW_QUERY_MS       = float(os.getenv("SLOW_QUERY_MS", "0"))   # 0 = slow-query log off
+EXPLAIN_COOLDOWN    = 60.0   # seconds before the same statement is EXPLAINed again
+PROFILE_TOP_N       = 40     # functions kept per profile, by cumulative time
+PARAM_MAX_CHARS     = 200
+
+
+class RingBuffer:
+    # Last `size` entries, each tagged with an increasing id
+    def __init__(self, size: int):
+        self._items = deque(maxlen=size)
+        self._ids   = itertools.count(1)
+        self._lock  = threading.Lock()
+
+    def add(self, entry: dict) -> int:
+        with self._lock:
+            entry["id"] = next(self._ids)
+            self._items.append(entry)
+            return entry["id"]
+
+    def list(self) -> list[dict]:
+        with self._lock:
+            return list(reversed(self._items))  # newest first
+
+    def get(self, entry_id: int) -> dict | None:
+        with self._lock:
+            return next((e for e in self._items if e["id"] == entry_id), None)
+
+
+profiles     = RingBuffer(50)
+slow_queries = RingBuffer(200)
+
+
+def is_admin(token: str | None) -> bool:
+    if ADMIN_TOKEN is None or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ══════════════════════════════════════════════════════════════
+#  REQUEST PROFILER
+# ══════════════════════════════════════════════════════════════
+
+class _RequestInfo:
+    __slots__ = ("route", "profile_wanted", "profile")
+
+    def __init__(self, route: str, profile_wanted: bool):
+        self.route          = route            # "GET /comments/" — shown in the slow-query log
+        self.profile_wanted = profile_wanted
+        self.profile: str | None = None    # formatted stats, set by the handler wrapper
+
+current_request: ContextVar[_RequestInfo | None] = ContextVar("current_request", default=None)
+
+
+_profile_lock = threading.Lock()
+
+
+def _profiled(endpoint):
+    # Sync handlers run in a threadpool worker, so the profile is started
+    # inside the handler call itself; formatting happens here too, off the
+    # event loop.
+    # Only one profile runs at a time: before 3.12 cProfile sees just its own
+    # thread, but from 3.12 on it hooks sys.monitoring, which is interpreter-wide
+    # — a second enable() raises ValueError and a running profile also picks
+    # up calls from every other thread. Requests that find the profiler busy
+    # simply run unprofiled
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        info = current_request.get()
+        if info is None or not info.profile_wanted:
+            return endpoint(*args, **kwargs)
+        if not _profile_lock.acquire(blocking=False):
+            return endpoint(*args, **kwargs)
+        try:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiling tool (debugger, coverage, ...) holds the hook
+                return endpoint(*args, **kwargs)
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                profile.disable()
+                info.profile = _format_profile(profile)
+        finally:
+            _profile_lock.release()
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    # Usage: APIRouter(..., route_class=ProfiledRoute)
+    def __init__(self, path, endpoint, **kwargs):
+        if not inspect.iscoroutinefunction(endpoint):
+            endpoint = _profiled(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _format_profile(profile: cProfile.Profile) -> str:
+    out = io.StringIO()
+    pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+    return out.getvalue()
+
+
+class DiagnosticsMiddleware:
+    # Tags every request with its route (for the slow-query log) and decides
+    # whether this one gets profiled
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        wanted = (
+            (headers.get(b"x-profile") == b"1"
+             and is_admin(headers.get(b"x-admin-token", b"").decode("latin-1")))
+            or (PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE)
+        )
+        info  = _RequestInfo(f"{scope['method']} {scope['path']}", wanted)
+        token = current_request.set(info)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            # the handler has returned by the time the response starts
+            if message["type"] == "http.response.start" and info.profile is not None:
+                profile_id = profiles.add({
+                    "at":          _now(),
+                    "route":       info.route,
+                    "status":      message["status"],
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "stats":       info.profile,
+                })
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", str(profile_id).encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request.reset(token)
+
+
+# ══════════════════════════════════════════════════════════════
+#  SLOW-QUERY LOG
+# ══════════════════════════════════════════════════════════════
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+_WRITES      = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+_last_explained: dict[str, float] = {}
+
+
+def _redact(parameters):
+    # Bound values as short strings; never log passwords
+    def short(value):
+        text = repr(value)
+        return text if len(text) <= PARAM_MAX_CHARS else text[:PARAM_MAX_CHARS] + "…"
+
+    # executemany passes a list of dicts — redact each of them
+    if isinstance(parameters, dict):
+        return {k: "***" if "password" in k else _redact(v) if isinstance(v, (dict, list, tuple)) else short(v)
+                for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(v) if isinstance(v, (dict, list, tuple)) else short(v) for v in parameters]
+    return short(parameters)
+
+
+def _explain(cursor, statement: str, parameters) -> list[str] | None:
+    # ANALYZE runs the statement a second time. Fine for reads, but a write
+    # would burn sequence values and could fail outright (duplicate key on
+    # the row the request just inserted), so writes — including a WITH that
+    # modifies data — only get the estimated plan.
+    # Either way it runs inside a savepoint on the same connection, so a
+    # failing EXPLAIN can't abort the request's transaction and no lock it
+    # holds can block it
+    head = statement.lstrip().upper()
+    if not head.startswith(_EXPLAINABLE):
+        return None
+    analyze = head.startswith(("SELECT", "WITH")) and not _WRITES.search(statement)
+    now = time.monotonic()
+    if now - _last_explained.get(statement, -EXPLAIN_COOLDOWN) < EXPLAIN_COOLDOWN:
+        return None
+    _last_explained[statement] = now
+
+    explain = cursor.connection.cursor()
+    try:
+        explain.execute("SAVEPOINT slow_query_explain")
+    except Exception:
+        return None
+    try:
+        options = "(ANALYZE, BUFFERS) " if analyze else ""
+        explain.execute(f"EXPLAIN {options}{statement}", parameters)
+        plan = [row[0] for row in explain.fetchall()]
+    except Exception as exc:
+        plan = [f"EXPLAIN failed: {exc}"]
+    finally:
+        explain.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        explain.execute("RELEASE SAVEPOINT slow_query_explain")
+        explain.close()
+    return plan
+
+
+def install_slow_query_log(engine: Engine, threshold_ms: float = SLOW_QUERY_MS) -> None:
+    if threshold_ms <= 0:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        context.slow_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_if_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context.slow_query_start) * 1000
+        if elapsed_ms < threshold_ms:
+            return
+        info = current_request.get()
+        slow_queries.add({
+            "at":          _now(),
+            "route":       info.route if info else None,
+            "duration_ms": round(elapsed_ms, 3),
+            "statement":   statement,
+            "parameters":  _redact(parameters),
+            "plan":        None if executemany else _explain(cursor, statement, parameters),
+        })
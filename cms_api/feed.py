@@ -0,0 +1,162 @@
+import threading
+import time
+from bisect import insort
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from models import PostOut, PostORM, PostStatus
+
+# ── Published-post feed ──────────────────────────────────────
+# One in-memory ring per category (plus key None for the home feed), holding
+# the newest FEED_CAPACITY published posts ordered by published_at desc.
+# create/update/delete_post push changes in after commit, and serialized pages
+# are cached per ring, so serving a warm feed page runs no query at all.
+#
+# State is per process: with several uvicorn workers each one keeps its own
+# copy, so a ring is also reloaded once it is FEED_TTL seconds old — that is
+# how long a change made through another worker can take to show up.
+
+FEED_CAPACITY  = 200
+FEED_TTL       = 30.0   # seconds
+FEED_MAX_PAGES = 32     # cached (limit, offset) bodies per ring, least recently used dropped
+
+_posts_json = TypeAdapter(list[PostOut])
+_NEVER = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _newest_first(post: PostOut):
+    return (-(post.published_at or _NEVER).timestamp(), -post.post_id)
+
+
+class _Ring:
+    __slots__ = ("items", "complete", "pages", "expires")
+
+    def __init__(self, items: list[PostOut], complete: bool):
+        self.items    = items      # newest first, at most FEED_CAPACITY
+        self.complete = complete   # True when items holds every published post
+        self.pages: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        self.expires  = time.monotonic() + FEED_TTL
+
+
+class PublishedFeed:
+    def __init__(self, capacity: int = FEED_CAPACITY):
+        self.capacity = capacity
+        self._lock    = threading.Lock()
+        self._rings: dict[Optional[int], _Ring] = {}
+        self._version = 0  # bumped on every change, guards rings loaded concurrently
+
+    # ── reads ────────────────────────────────────────────────
+    def is_loaded(self, category_id: Optional[int]) -> bool:
+        with self._lock:
+            return self._fresh_ring(category_id) is not None
+
+    def _fresh_ring(self, category_id: Optional[int]) -> Optional[_Ring]:
+        # caller holds the lock; expired rings are dropped here
+        ring = self._rings.get(category_id)
+        if ring is not None and ring.expires <= time.monotonic():
+            del self._rings[category_id]
+            return None
+        return ring
+
+    def page(self, db: Session, category_id: Optional[int], limit: int, offset: int) -> bytes:
+        key = (limit, offset)
+        with self._lock:
+            ring = self._fresh_ring(category_id)
+            if ring is not None and key in ring.pages:
+                ring.pages.move_to_end(key)
+                return ring.pages[key]
+            version = self._version
+
+        if ring is None:
+            ring = self._load(db, category_id)
+            with self._lock:
+                if self._version == version:
+                    self._rings.setdefault(category_id, ring)
+
+        with self._lock:
+            version = self._version
+            window  = ring.items[offset:offset + limit]
+            beyond  = offset + limit > len(ring.items) and not ring.complete
+            inside  = offset < len(ring.items)
+
+        # past the retained window — answer from the DB, don't cache
+        if beyond:
+            return _posts_json.dump_json(self._query(db, category_id, limit, offset))
+
+        body = _posts_json.dump_json(window)
+        with self._lock:
+            # only cache if nothing changed since slicing, and never the
+            # empty pages past the end (one per offset, unbounded)
+            if inside and self._version == version and self._rings.get(category_id) is ring:
+                ring.pages[key] = body
+                if len(ring.pages) > FEED_MAX_PAGES:
+                    ring.pages.popitem(last=False)
+        return body
+
+    def _query(self, db: Session, category_id: Optional[int], limit: int, offset: int) -> list[PostOut]:
+        query = db.query(PostORM).filter(PostORM.status == PostStatus.published)
+        if category_id is not None:
+            query = query.filter(PostORM.category_id == category_id)
+        rows = (
+            query.order_by(PostORM.published_at.desc(), PostORM.post_id.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        return [PostOut.model_validate(row) for row in rows]
+
+    def _load(self, db: Session, category_id: Optional[int]) -> _Ring:
+        items = self._query(db, category_id, self.capacity + 1, 0)
+        complete = len(items) <= self.capacity
+        return _Ring(items[:self.capacity], complete)
+
+    # ── incremental updates (call after commit) ──────────────
+    def apply(self, post: PostOut) -> None:
+        # Publish, edit, move between categories or unpublish — all the same path
+        wanted = {None, post.category_id} if post.status == PostStatus.published else set()
+        with self._lock:
+            self._version += 1
+            for key, ring in list(self._rings.items()):
+                removed = self._take(ring, post.post_id)
+                if key in wanted:
+                    insort(ring.items, post, key=_newest_first)
+                    if len(ring.items) > self.capacity:
+                        ring.items.pop()
+                        ring.complete = False
+                elif removed and not ring.complete:
+                    # a post beyond the window should slide in — reload on next read
+                    del self._rings[key]
+                    continue
+                if removed or key in wanted:
+                    ring.pages.clear()
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            self._version += 1
+            for key, ring in list(self._rings.items()):
+                if not self._take(ring, post_id):
+                    continue
+                if ring.complete:
+                    ring.pages.clear()
+                else:
+                    del self._rings[key]
+
+    def drop_category(self, category_id: int) -> None:
+        with self._lock:
+            self._version += 1
+            self._rings.pop(category_id, None)
+
+    @staticmethod
+    def _take(ring: _Ring, post_id: int) -> bool:
+        for index, item in enumerate(ring.items):
+            if item.post_id == post_id:
+                del ring.items[index]
+                return True
+        return False
+
+
+published_feed = PublishedFeed()
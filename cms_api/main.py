@@ -1,11 +1,24 @@
+import asyncio
+import logging
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from database import engine, Base
 from routes_user_category import user_router, category_router
 from routes_post_comment   import post_router, comment_router
+from routes_feed           import feed_router
+from routes_admin          import admin_router
+from admission             import AdmissionControlMiddleware
+from diagnostics           import DiagnosticsMiddleware, install_slow_query_log
 
 # Import all ORM models so Base.metadata knows about them
 # This ensures create_all() picks up every table
-from models import UserORM, CategoryORM, PostORM, CommentORM
+from models import UserORM, CategoryORM, PostORM, CommentORM, ensure_comment_partitions
+
+logger = logging.getLogger("cms_api")
+
+# How often to top up future comment partitions (see models SECTION 4)
+PARTITION_MAINTENANCE_INTERVAL = 24 * 60 * 60  # seconds
 
 app = FastAPI(
     title="CMS API — Retail Website Blog",
@@ -13,17 +26,52 @@ app = FastAPI(
     version="2.0.0",
 )
 
+# Opt-in request profiler + route tagging for the slow-query log (diagnostics.py)
+app.add_middleware(DiagnosticsMiddleware)
+install_slow_query_log(engine)
+
+# Sheds excess load with 503 + Retry-After before it queues on the DB pool
+# Added last so it runs first
+app.add_middleware(AdmissionControlMiddleware)
+
 @app.on_event("startup")
 def startup():
     # Creates tables if they don't exist yet
     # Safe to run on every startup — won't touch existing tables
     # In production, prefer: alembic upgrade head (already done)
     Base.metadata.create_all(bind=engine)
+    _ensure_partitions()
+
+
+def _ensure_partitions():
+    with engine.begin() as conn:
+        created = ensure_comment_partitions(conn)
+    if created:
+        logger.info("created %d comment partition(s)", created)
+
+
+async def _partition_maintenance_loop():
+    # Keeps months_ahead partitions ahead of now() on long-running processes,
+    # so new comments never pile up in comment_default
+    while True:
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL)
+        try:
+            await run_in_threadpool(_ensure_partitions)
+        except Exception:
+            logger.exception("comment partition maintenance failed")
+
+
+@app.on_event("startup")
+async def schedule_partition_maintenance():
+    # keep a reference so the task isn't garbage-collected mid-sleep
+    app.state.partition_task = asyncio.create_task(_partition_maintenance_loop())
 
 app.include_router(user_router)
 app.include_router(category_router)
 app.include_router(post_router)
 app.include_router(comment_router)
+app.include_router(feed_router)
+app.include_router(admin_router)
 
 @app.get("/", tags=["Health"])
 def health():
@@ -3,7 +3,8 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr, field_validator
-from sqlalchemy import Integer, String, Text, Enum as SAEnum, ForeignKey, Index, func
+from sqlalchemy import Integer, String, Text, Enum as SAEnum, ForeignKey, Index, func, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 
@@ -230,24 +231,116 @@ class PostORM(Base):
 
 
 # ── COMMENT ORM ──────────────────────────────────────────────
+# Partitioned by RANGE (created_at) per month, each month by HASH (post_id)
+# created_at and post_id are part of the primary key (Postgres requires the
+# partition key of every level in it); created_at gets a Python default so
+# the full key is known without a round trip
 class CommentORM(Base):
     __tablename__ = "comment"
     __table_args__ = (
         Index("idx_comment_post", "post_id"),
         Index("idx_comment_user", "user_id"),
-        {"schema": "mg_schema"},  # dict MUST be last
+        {"schema": "mg_schema", "postgresql_partition_by": "RANGE (created_at)"},  # dict MUST be last
     )
 
     comment_id  : Mapped[int]           = mapped_column(Integer, primary_key=True, autoincrement=True)
-    post_id     : Mapped[int]           = mapped_column(Integer, ForeignKey("mg_schema.post.post_id", ondelete="CASCADE"), nullable=False)
+    post_id     : Mapped[int]           = mapped_column(Integer, ForeignKey("mg_schema.post.post_id", ondelete="CASCADE"), primary_key=True)
     user_id     : Mapped[int]           = mapped_column(Integer, ForeignKey("mg_schema.user.user_id"), nullable=False)
     category_id : Mapped[int]           = mapped_column(Integer, ForeignKey("mg_schema.category.category_id"), nullable=False)
     body        : Mapped[str]           = mapped_column(Text, nullable=False)
-    created_at  : Mapped[datetime]      = mapped_column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    created_at  : Mapped[datetime]      = mapped_column(TIMESTAMP(timezone=True), primary_key=True, default=_utcnow, server_default=func.now())
     created_by  : Mapped[int | None]    = mapped_column(Integer, ForeignKey("mg_schema.user.user_id"), nullable=True)
     updated_at  : Mapped[datetime]      = mapped_column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=_utcnow)
     updated_by  : Mapped[int | None]    = mapped_column(Integer, ForeignKey("mg_schema.user.user_id"), nullable=True)
 
     post      : Mapped["PostORM"]     = relationship("PostORM",     back_populates="comments")
     commenter : Mapped["UserORM"]     = relationship("UserORM",     back_populates="comments", foreign_keys=[user_id])
-    category  : Mapped["CategoryORM"] = relationship("CategoryORM", back_populates="comments")
\ No newline at end of file
+    category  : Mapped["CategoryORM"] = relationship("CategoryORM", back_populates="comments")
+
+# ═══════════════════════════════════════════════════════════════
+#  SECTION 4 — COMMENT PARTITION MAINTENANCE
+#  The live definition of mg_schema.ensure_comment_partitions(); it is
+#  (re)installed by ensure_comment_partitions() on startup, so create_all()
+#  and alembic databases both run this version
+# ═══════════════════════════════════════════════════════════════
+
+COMMENT_PARTITION_MONTHS_AHEAD = 3
+
+COMMENT_PARTITION_FN_SQL = """
+CREATE OR REPLACE FUNCTION mg_schema.ensure_comment_partitions(
+    months_ahead integer     DEFAULT 3,
+    from_month   timestamptz DEFAULT NULL
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    hash_buckets CONSTANT integer := 4;
+    month_start  timestamp := date_trunc('month', coalesce(from_month, now()) AT TIME ZONE 'UTC');
+    last_month   timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead);
+    lower_bound  timestamptz;
+    upper_bound  timestamptz;
+    part_name    text;
+    created      integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('mg_schema.comment partitions'));
+
+    WHILE month_start <= last_month LOOP
+        part_name   := 'comment_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+        lower_bound := month_start AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+        IF to_regclass('mg_schema.' || part_name) IS NULL THEN
+            CREATE TEMP TABLE comment_spill (LIKE mg_schema.comment) ON COMMIT DROP;
+            WITH moved AS (
+                DELETE FROM mg_schema.comment_default
+                 WHERE created_at >= lower_bound AND created_at < upper_bound
+                RETURNING *
+            )
+            INSERT INTO comment_spill SELECT * FROM moved;
+
+            EXECUTE format(
+                'CREATE TABLE mg_schema.%I PARTITION OF mg_schema.comment '
+                'FOR VALUES FROM (%L) TO (%L) PARTITION BY HASH (post_id)',
+                part_name, lower_bound, upper_bound
+            );
+            FOR bucket IN 0 .. hash_buckets - 1 LOOP
+                EXECUTE format(
+                    'CREATE TABLE mg_schema.%I PARTITION OF mg_schema.%I '
+                    'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+                    part_name || '_p' || bucket, part_name, hash_buckets, bucket
+                );
+            END LOOP;
+
+            INSERT INTO mg_schema.comment SELECT * FROM comment_spill;
+            DROP TABLE comment_spill;
+            created := created + 1;
+        END IF;
+
+        month_start := month_start + interval '1 month';
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+
+def ensure_comment_partitions(conn: Connection, months_ahead: int = COMMENT_PARTITION_MONTHS_AHEAD) -> int:
+    # Returns how many monthly partitions were created
+    # No-op (0) on a database whose comment table is not partitioned yet
+    # (run: alembic upgrade head)
+    partitioned = conn.execute(text(
+        "SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('mg_schema.comment')"
+    )).scalar()
+    if not partitioned:
+        return 0
+
+    # Same lock the function takes: workers starting together install,
+    # create the default partition and add months one at a time
+    conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('mg_schema.comment partitions'))"))
+    conn.execute(text(COMMENT_PARTITION_FN_SQL))
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS mg_schema.comment_default PARTITION OF mg_schema.comment DEFAULT"
+    ))
+    return conn.execute(
+        text("SELECT mg_schema.ensure_comment_partitions(:months_ahead)"),
+        {"months_ahead": months_ahead},
+    ).scalar()
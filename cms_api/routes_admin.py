@@ -0,0 +1,73 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Header, Depends
+
+from admission import limiter
+from diagnostics import ADMIN_TOKEN, is_admin, profiles, slow_queries
+
+
+# Admin routes are open while ADMIN_TOKEN is unset (like the rest of this API);
+# once it is set they require a matching X-Admin-Token header
+def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    if ADMIN_TOKEN is not None and not is_admin(x_admin_token):
+        raise HTTPException(403, "Admin token required")
+
+
+# Profiles and slow queries hold bound parameters (emails, comment bodies)
+# and stacks — these fail closed: no ADMIN_TOKEN, no access
+def require_diagnostics_access(x_admin_token: Optional[str] = Header(default=None)):
+    if ADMIN_TOKEN is None:
+        raise HTTPException(403, "Set ADMIN_TOKEN to browse diagnostics")
+    if not is_admin(x_admin_token):
+        raise HTTPException(403, "Admin token required")
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+# ══════════════════════════════════════════════════════════════
+#  ADMISSION CONTROL
+# ══════════════════════════════════════════════════════════════
+
+@admin_router.get("/admission")
+def admission_metrics():
+    # Current concurrency limit, in-flight / admitted / rejected counts per
+    # priority class and connection pool health
+    return limiter.snapshot()
+
+
+# ══════════════════════════════════════════════════════════════
+#  PROFILES  (diagnostics.profiles ring buffer)
+# ══════════════════════════════════════════════════════════════
+
+@admin_router.get("/profiles", dependencies=[Depends(require_diagnostics_access)])
+def list_profiles():
+    # newest first, without the call stats
+    return [{k: v for k, v in entry.items() if k != "stats"} for entry in profiles.list()]
+
+
+@admin_router.get("/profiles/{profile_id}", dependencies=[Depends(require_diagnostics_access)])
+def get_profile(profile_id: int):
+    entry = profiles.get(profile_id)
+    if not entry:
+        raise HTTPException(404, "Profile not found")
+    return entry
+
+
+# ══════════════════════════════════════════════════════════════
+#  SLOW QUERIES  (diagnostics.slow_queries ring buffer)
+# ══════════════════════════════════════════════════════════════
+
+@admin_router.get("/slow-queries", dependencies=[Depends(require_diagnostics_access)])
+def list_slow_queries(route: Optional[str] = None):
+    entries = slow_queries.list()
+    if route:
+        entries = [e for e in entries if e["route"] and route in e["route"]]
+    return entries
+
+
+@admin_router.get("/slow-queries/{query_id}", dependencies=[Depends(require_diagnostics_access)])
+def get_slow_query(query_id: int):
+    entry = slow_queries.get(query_id)
+    if not entry:
+        raise HTTPException(404, "Slow query not found")
+    return entry
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from sqlalchemy.orm import Session
+
+from database import get_db
+from diagnostics import ProfiledRoute
+from feed import published_feed, FEED_CAPACITY
+from models import PostOut, CategoryORM
+
+feed_router = APIRouter(tags=["Feed"], route_class=ProfiledRoute)
+
+
+# ══════════════════════════════════════════════════════════════
+#  FEED  (newest published posts, served from feed.published_feed)
+# ══════════════════════════════════════════════════════════════
+
+@feed_router.get("/feed", response_model=list[PostOut])
+def home_feed(
+    limit:  int = Query(default=20, ge=1, le=FEED_CAPACITY),
+    offset: int = Query(default=0,  ge=0),
+    db: Session = Depends(get_db)
+):
+    body = published_feed.page(db, None, limit, offset)
+    return Response(content=body, media_type="application/json")
+
+
+@feed_router.get("/categories/{category_id}/feed", response_model=list[PostOut])
+def category_feed(
+    category_id: int,
+    limit:  int = Query(default=20, ge=1, le=FEED_CAPACITY),
+    offset: int = Query(default=0,  ge=0),
+    db: Session = Depends(get_db)
+):
+    # only a cold feed needs to confirm the category exists
+    if not published_feed.is_loaded(category_id):
+        category = db.query(CategoryORM).filter(CategoryORM.category_id == category_id).first()
+        if not category:
+            raise HTTPException(404, "Category not found")
+    body = published_feed.page(db, category_id, limit, offset)
+    return Response(content=body, media_type="application/json")
@@ -4,6 +4,8 @@ from typing import Optional
 from datetime import datetime, timezone
 
 from database import get_db
+from diagnostics import ProfiledRoute
+from feed import published_feed
 from models import (
     PostCreate, PostUpdate, PostOut,
     CommentCreate, CommentUpdate, CommentOut,
@@ -11,8 +13,8 @@ from models import (
     PostStatus
 )
 
-post_router    = APIRouter(prefix="/posts",    tags=["Posts"])
-comment_router = APIRouter(prefix="/comments", tags=["Comments"])
+post_router    = APIRouter(prefix="/posts",    tags=["Posts"], route_class=ProfiledRoute)
+comment_router = APIRouter(prefix="/comments", tags=["Comments"], route_class=ProfiledRoute)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -39,6 +41,7 @@ def create_post(
     db.add(post)
     db.commit()
     db.refresh(post)
+    published_feed.apply(PostOut.model_validate(post))
     return post
 
 
@@ -88,6 +91,7 @@ def update_post(
 
     db.commit()
     db.refresh(post)
+    published_feed.apply(PostOut.model_validate(post))
     return post
 
 
@@ -98,6 +102,7 @@ def delete_post(post_id: int, db: Session = Depends(get_db)):
         raise HTTPException(404, "Post not found")
     db.delete(post)
     db.commit()
+    published_feed.remove(post_id)
 
 
 # ══════════════════════════════════════════════════════════════
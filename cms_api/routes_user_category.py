@@ -4,14 +4,16 @@ from typing import Optional
 from datetime import datetime, timezone
 
 from database import get_db
+from diagnostics import ProfiledRoute
+from feed import published_feed
 from models import (
     UserCreate, UserUpdate, UserOut,
     CategoryCreate, CategoryUpdate, CategoryOut,
     UserORM, CategoryORM
 )
 
-user_router     = APIRouter(prefix="/users",      tags=["Users"])
-category_router = APIRouter(prefix="/categories", tags=["Categories"])
+user_router     = APIRouter(prefix="/users",      tags=["Users"], route_class=ProfiledRoute)
+category_router = APIRouter(prefix="/categories", tags=["Categories"], route_class=ProfiledRoute)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -159,4 +161,5 @@ def delete_category(category_id: int, db: Session = Depends(get_db)):
     if not category:
         raise HTTPException(404, "Category not found")
     db.delete(category)
-    db.commit()
\ No newline at end of file
+    db.commit()
+    published_feed.drop_category(category_id)
\ No newline at end of file